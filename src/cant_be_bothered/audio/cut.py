@@ -1,6 +1,7 @@
 from pathlib import Path
 from typing import Optional, Union
 import torchaudio
+from torchcodec.decoders import AudioDecoder
 from .utils import parse_time_str
 
 
@@ -10,6 +11,22 @@ def get_range_output_path(input_path: Path, start_sec: float, end_sec: float) ->
     )
 
 
+def get_audio_duration(input_path: Union[str, Path]) -> float:
+    """
+    Duration of an audio file in seconds.
+
+    Reads only the header when the format allows it, otherwise decodes the file.
+    """
+    return _decoder_duration(AudioDecoder(str(input_path)))
+
+
+def _decoder_duration(decoder: AudioDecoder) -> float:
+    duration = decoder.metadata.duration_seconds_from_header
+    if duration:
+        return duration
+    return decoder.get_all_samples().duration_seconds
+
+
 def cut_audio_segment(
     input_path: Union[str, Path],
     start: Optional[str] = None,
@@ -26,15 +43,16 @@ def cut_audio_segment(
     Raises
     - FileNotFoundError: if input file does not exist
     - ValueError: if start/end times are invalid
-    - Any other exceptions raised by torchaudio.load or torchaudio.save
+    - Any other exceptions raised by AudioDecoder or torchaudio.save
     """
     input_path = Path(input_path)
     if not input_path.exists():
         raise FileNotFoundError(f"Input not found: {input_path}")
 
-    waveform, sr = torchaudio.load(str(input_path))
+    # Only the requested range is decoded, not the whole file
+    decoder = AudioDecoder(str(input_path))
 
-    duration_sec = waveform.shape[1] / sr
+    duration_sec = _decoder_duration(decoder)
 
     start_sec = 0 if start is None else parse_time_str(start)
 
@@ -50,16 +68,13 @@ def cut_audio_segment(
     # clamp end and duration
     end_sec = min(end_sec, duration_sec)
 
-    start_sample = int(round(start_sec * sr))
-    end_sample = int(round(end_sec * sr))
-
-    cut_waveform = waveform[:, start_sample:end_sample]
+    samples = decoder.get_samples_played_in_range(start_sec, end_sec)
 
     if output_path is None:
         out = get_range_output_path(input_path, start_sec, end_sec)
     else:
         out = Path(output_path)
 
-    torchaudio.save(str(out), cut_waveform, sr)
+    torchaudio.save(str(out), samples.data, samples.sample_rate)
 
     return out
@@ -1,3 +1,5 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 
@@ -6,23 +8,64 @@ import tempfile
 import typer
 from rich.console import Console
 from rich.markdown import Markdown
-from rich.progress import Progress, SpinnerColumn, TextColumn
-
+from rich.markup import escape
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
+from rich.table import Table
+from typer.core import TyperGroup
+
+from cant_be_bothered.summarization.compaction import (
+    CompactionConfig,
+    compact_transcript,
+    segments_from_text,
+)
 from cant_be_bothered.summarization.gemini_client import GeminiClient
+from cant_be_bothered.summarization.transport import TransportConfig
 from cant_be_bothered.audio.convert import convert_to_wav
 from cant_be_bothered.audio.cut import cut_audio_segment
+from cant_be_bothered.search.index import INDEX_NAME, TranscriptIndex
+from cant_be_bothered.transcription.segments import format_timestamp
+from cant_be_bothered.transcription.sinks import (
+    SINK_FORMATS,
+    CollectingSink,
+    FlushPolicy,
+    MarkdownSink,
+    PreviewSink,
+    create_sink,
+    read_jsonl_segments,
+    render_text,
+    sink_path,
+)
 
 import warnings
 warnings.filterwarnings("ignore", category=UserWarning, module="ctranslate2")
 
+from cant_be_bothered.transcription import models as model_store  # noqa: E402
 from cant_be_bothered.transcription.transcriber import transcribe_audio  # noqa: E402
+from cant_be_bothered.transcription.watch import FolderWatcher  # noqa: E402
+
+
+class DefaultCommandGroup(TyperGroup):
+    """Runs `main` when the first argument is not a subcommand, so `transcribe meeting.mp3` keeps working."""
+
+    default_command = "main"
+
+    def parse_args(self, ctx, args):
+        if args and args[0] not in self.commands and args[0] not in ctx.help_option_names:
+            args.insert(0, self.default_command)
+        return super().parse_args(ctx, args)
 
 
 app = typer.Typer(
     name="transcribe",
     help="Transcribe audio files to text using Whisper",
     add_completion=False,
+    cls=DefaultCommandGroup,
+)
+models_app = typer.Typer(
+    help="Manage the local model store (prefetched Whisper and diarization models)",
+    no_args_is_help=True,
 )
+app.add_typer(models_app, name="models")
 console = Console()
 
 
@@ -34,7 +77,61 @@ def success(message: str) -> None:
     console.print(f":white_check_mark: [bold green]Success:[/bold green] {message}")
 
 
-@app.command()
+BUILTIN_VARIANTS = ("minutes", "simple")
+# Output <name>.transcript.md is the Markdown transcript (MarkdownSink)
+RESERVED_VARIANT_NAMES = ("transcript",)
+
+
+def variant_name(variant: str) -> str:
+    """Output name of a --variant value (builtin name or stem of the instructions file)."""
+    return variant if variant in BUILTIN_VARIANTS else Path(variant).stem
+
+
+def check_variants(variants: list[str]) -> Optional[str]:
+    """Returns error message if the variants are unknown or their output names collide."""
+    names = set()
+    for variant in variants:
+        if variant not in BUILTIN_VARIANTS and not Path(variant).is_file():
+            return f"Unknown variant '{variant}' (use {', '.join(BUILTIN_VARIANTS)} or path to instructions file)"
+
+        name = variant_name(variant)
+        if variant not in BUILTIN_VARIANTS and name in (*BUILTIN_VARIANTS, *RESERVED_VARIANT_NAMES):
+            return f"Variant file '{variant}' uses reserved name '{name}', rename the file"
+        if name in names:
+            return f"Variant name '{name}' is used more than once"
+        names.add(name)
+    return None
+
+
+def resolve_variants(gemini_client: GeminiClient, variants: list[str]) -> dict[str, str]:
+    """Map --variant values (builtin names or instruction files) to output name -> instructions."""
+    resolved = {}
+    for variant in variants:
+        if variant == "minutes":
+            resolved[variant] = gemini_client.meeting_minutes_variant()
+        elif variant == "simple":
+            resolved[variant] = gemini_client.simple_summary_variant()
+        else:
+            resolved[variant_name(variant)] = Path(variant).read_text(encoding="utf-8")
+    return resolved
+
+
+def activate_model_store(model_size: str, diarization: bool = False) -> None:
+    """Use the local model store if it has every model the run needs, say why not otherwise."""
+    store = model_store.default_store()
+    if model_store.use_local_store(model_size, diarization, store):
+        console.print(f"[dim]Using local model store: {store}[/dim]")
+        return
+
+    if model_store.read_manifest(store):
+        missing = model_store.missing_models(store, model_size, diarization)
+        console.print(
+            f"[dim]Local model store lacks {', '.join(missing)} - using Hugging Face "
+            f"(run `transcribe models prefetch -m {model_size}` for offline runs)[/dim]"
+        )
+
+
+@app.command(help="Transcribe audio file (default command)")
 def main(
     audio_file: Path = typer.Argument(
         ...,
@@ -94,6 +191,13 @@ def main(
         "--simple",
         help="Generate simple bullet-point summary (instead of full minutes)",
     ),
+    variants: list[str] = typer.Option(
+        [],
+        "--variant",
+        "-V",
+        help="Generate several outputs from one cached transcript (repeatable): "
+        "minutes, simple or path to a file with custom instructions. Implies --summarize",
+    ),
     enable_diarization: bool = typer.Option(
         False,
         "--diarize",
@@ -109,10 +213,93 @@ def main(
         "--max-speakers",
         help="Maximum number of speakers for diarization",
     ),
+    compact: bool = typer.Option(
+        True,
+        "--compact/--no-compact",
+        help="Compact transcript before summarization (repetitions, fillers, merged speaker turns)",
+    ),
+    fillers: Optional[str] = typer.Option(
+        None,
+        "--fillers",
+        help="Comma-separated filler words/phrases removed by compaction (empty string disables)",
+    ),
+    compact_timestamps: bool = typer.Option(
+        False,
+        "--compact-timestamps",
+        help="Keep compact [mm:ss] timestamps in the transcript sent to Gemini",
+    ),
+    formats: list[str] = typer.Option(
+        ["txt"],
+        "--format",
+        "-f",
+        help=f"Transcript output format, repeatable: {', '.join(SINK_FORMATS)}",
+    ),
+    flush_interval: float = typer.Option(
+        2.0,
+        "--flush-interval",
+        help="Flush transcript files at most every N seconds (0 = after every segment)",
+    ),
+    flush_bytes: int = typer.Option(
+        64 * 1024,
+        "--flush-bytes",
+        help="Flush transcript files once this many bytes are pending (0 = no limit)",
+    ),
+    fsync: bool = typer.Option(
+        False,
+        "--fsync",
+        help="fsync transcript files on every flush",
+    ),
+    echo: bool = typer.Option(
+        True,
+        "--echo/--no-echo",
+        help="Print the transcript to the console when done",
+    ),
+    echo_limit: int = typer.Option(
+        2000,
+        "--echo-limit",
+        help="Maximum number of transcript characters printed to the console",
+    ),
 ) -> None:
     console.print("[bold green]Cant Be Bothered AI - Transcription CLI[/bold green]\n")
     console.print(f"[dim]Input file: {audio_file}[/dim]")
 
+    error = check_variants(variants)
+    if error is not None:
+        fail(error)
+        raise typer.Exit(code=1)
+    summarize = summarize or bool(variants)
+
+    for fmt in formats:
+        if fmt not in SINK_FORMATS:
+            fail(f"Unknown output format '{fmt}' (choose from: {', '.join(SINK_FORMATS)})")
+            raise typer.Exit(code=1)
+
+    if output is None:
+        # Default output directory
+        output_dir = Path("output")
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Determine output file extension based on summarization
+        if summarize:
+            output = output_dir / audio_file.with_suffix(".md").name
+        else:
+            output = output_dir / audio_file.with_suffix(".txt").name
+
+    # Transcript files - when summarizing, the output path belongs to the minutes
+    transcript_paths = {
+        fmt: sink_path(output, fmt) if fmt != "txt" else output
+        for fmt in dict.fromkeys(formats)
+    }
+    if summarize and "txt" in transcript_paths:
+        transcript_paths["txt"] = output.with_suffix(
+            ".transcript.txt" if output.suffix == ".txt" else ".txt"
+        )
+    if summarize and output in transcript_paths.values():
+        fail(f"Minutes would overwrite the transcript {output}, choose a different --output")
+        raise typer.Exit(code=1)
+
+    activate_model_store(model, enable_diarization)
+
     tmp_context = None
     try:
         with Progress(
@@ -180,8 +367,26 @@ def main(
             f"[dim]Model: {model} | Language: {language} | Device: {device}[/dim] \n"
         )
 
+        flush_policy = FlushPolicy(
+            interval=flush_interval, max_bytes=flush_bytes, fsync=fsync
+        )
+        sinks = [
+            create_sink(fmt, path, flush_policy=flush_policy)
+            for fmt, path in transcript_paths.items()
+        ]
+
+        preview = None
+        if echo and not summarize:
+            preview = PreviewSink(limit=echo_limit)
+            sinks.append(preview)
+
+        collector = None
+        if summarize:
+            collector = CollectingSink()
+            sinks.append(collector)
+
         # Transcribe audio (progress bar is handled inside transcribe_audio)
-        transcript = transcribe_audio(
+        transcribe_audio(
             audio_path=working_file,
             model_size=model,
             language=language,
@@ -189,34 +394,47 @@ def main(
             enable_diarization=enable_diarization,
             min_speakers=min_speakers,
             max_speakers=max_speakers,
+            sinks=sinks,
         )
 
-        if output is None:
-            # Default output directory
-            output_dir = Path("output")
-            output_dir.mkdir(parents=True, exist_ok=True)
-
-            # Determine output file extension based on summarization
-            if summarize:
-                output = output_dir / audio_file.with_suffix(".md").name
-            else:
-                output = output_dir / audio_file.with_suffix(".txt").name
+        for path in transcript_paths.values():
+            console.print(f"[dim]Saved to: {path}[/dim]")
+        console.print()
 
-        # Save raw transcript
-        if not summarize:
-            output.write_text(transcript, encoding="utf-8")
-            console.print(f"[dim]Saved to: {output}[/dim]\n")
+        if preview is not None:
             console.print("[bold]Transcript:[/bold]")
-            console.print(f"[cyan]{transcript}[/cyan]")
-        else:
+            console.print(preview.preview(), style="cyan", markup=False)
+            if preview.truncated:
+                console.print(
+                    f"[dim]... truncated, {preview.total_chars:,} characters in total[/dim]"
+                )
+
+        if summarize:
             # Generate meeting minutes with Gemini
             console.print("\n[bold blue]Generating meeting minutes...[/bold blue]")
 
+            transcript = collector.text()
+            if compact:
+                config = CompactionConfig(timestamps=compact_timestamps)
+                if fillers is not None:
+                    config.fillers = frozenset(
+                        f.strip().lower() for f in fillers.split(",") if f.strip()
+                    )
+                result = compact_transcript(collector.segments, transcript, config)
+                transcript = result.text
+                console.print(
+                    f"[dim]Compaction: {result.original_tokens:,} -> {result.compacted_tokens:,} "
+                    f"tokens (estimate, -{result.reduction:.0%})[/dim]"
+                )
+
             try:
                 gemini_client = GeminiClient()
 
-                token_count = gemini_client.count_tokens(transcript)
-                console.print(f"[dim]Transcript tokens: {token_count:,}[/dim]")
+                # With variants the transcript is uploaded once - the usage line below
+                # reports its tokens, an extra count_tokens request would upload it again
+                if not variants:
+                    token_count = gemini_client.count_tokens(transcript)
+                    console.print(f"[dim]Transcript tokens: {token_count:,}[/dim]")
 
                 with Progress(
                     SpinnerColumn(),
@@ -225,22 +443,41 @@ def main(
                 ) as progress:
                     task = progress.add_task("Processing with Gemini AI...", total=None)
 
-                    if simple:
-                        summary = gemini_client.generate_simple_summary(transcript)
+                    if variants:
+                        results = gemini_client.generate_outputs(
+                            transcript, resolve_variants(gemini_client, variants)
+                        )
+                        summaries = {
+                            output.with_suffix(f".{name}.md"): summary
+                            for name, summary in results.items()
+                        }
+                    elif simple:
+                        summaries = {
+                            output: gemini_client.generate_simple_summary(transcript)
+                        }
                     else:
-                        summary = gemini_client.generate_meeting_minutes(transcript)
+                        summaries = {
+                            output: gemini_client.generate_meeting_minutes(transcript)
+                        }
 
                     progress.update(task, description="Minutes generated!")
 
-                # Save markdown output
-                output.write_text(summary, encoding="utf-8")
+                usage = gemini_client.usage
+                console.print(
+                    f"[dim]Gemini tokens: {usage.prompt_tokens:,} input "
+                    f"({usage.cached_tokens:,} from cache), {usage.output_tokens:,} output[/dim]"
+                )
+
+                for path, summary in summaries.items():
+                    # Save markdown output
+                    path.write_text(summary, encoding="utf-8")
 
-                success(f"Meeting minutes saved to: {output}")
-                console.print()
+                    success(f"Meeting minutes saved to: {path}")
+                    console.print()
 
-                # Display formatted markdown
-                md = Markdown(summary)
-                console.print(md)
+                    # Display formatted markdown
+                    md = Markdown(summary)
+                    console.print(md)
 
             except ValueError as e:
                 fail(f"{e}\n\nSet GEMINI_API_KEY in .env file or environment variable.")
@@ -259,5 +496,434 @@ def main(
             tmp_context.cleanup()
 
 
+@app.command("watch")
+def watch(
+    directory: Path = typer.Argument(
+        ...,
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        readable=True,
+        help="Directory with recordings to watch",
+    ),
+    output_dir: Path = typer.Option(
+        Path("output"),
+        "--output-dir",
+        "-o",
+        help="Directory for the transcripts",
+    ),
+    model: str = typer.Option(
+        "large-v3",
+        "--model",
+        "-m",
+        help="Whisper model size: tiny, base, small, medium, large-v3",
+    ),
+    device: str = typer.Option(
+        "auto",
+        "--device",
+        "-d",
+        help="Device to use for transcription: auto, cpu, cuda",
+    ),
+    language: str = typer.Option(
+        "sk",
+        "--language",
+        "-l",
+        help="Language code (sk for Slovak)",
+    ),
+    formats: list[str] = typer.Option(
+        ["txt", "jsonl"],
+        "--format",
+        "-f",
+        help=f"Transcript output format, repeatable: {', '.join(SINK_FORMATS)}",
+    ),
+    workers: int = typer.Option(
+        2,
+        "--workers",
+        "-w",
+        help="Number of recordings transcribed in parallel",
+    ),
+    poll_interval: float = typer.Option(
+        5.0,
+        "--poll-interval",
+        help="Seconds between directory scans",
+    ),
+    debounce: float = typer.Option(
+        10.0,
+        "--debounce",
+        help="Process a file only after it was not modified for N seconds",
+    ),
+    once: bool = typer.Option(
+        False,
+        "--once",
+        help="Process recordings that are ready now and exit",
+    ),
+) -> None:
+    """Transcribe new recordings in a directory, and only the new audio of growing ones."""
+    for fmt in formats:
+        if fmt not in SINK_FORMATS:
+            fail(f"Unknown output format '{fmt}' (choose from: {', '.join(SINK_FORMATS)})")
+            raise typer.Exit(code=1)
+
+    activate_model_store(model)
+
+    watcher = FolderWatcher(
+        directory=directory,
+        output_dir=output_dir,
+        formats=list(dict.fromkeys(formats)),
+        workers=workers,
+        poll_interval=poll_interval,
+        debounce=debounce,
+        model_size=model,
+        language=language,
+        device=device,
+    )
+
+    console.print(f"[bold green]Watching:[/bold green] {directory} [dim](Ctrl+C to stop)[/dim]")
+    try:
+        watcher.run(once=once)
+    except KeyboardInterrupt:
+        console.print("[dim]Stopped watching[/dim]")
+
+
+# Transcript file suffixes, longest first (<name>.transcript.txt is written next to <name>.md minutes)
+TRANSCRIPT_SUFFIXES = (".transcript.txt", ".txt", ".jsonl")
+
+
+def minutes_path(output_dir: Path, transcript: Path) -> Path:
+    """Path of the minutes generated from `transcript` (output/<name>.md)."""
+    name = transcript.name
+    for suffix in TRANSCRIPT_SUFFIXES:
+        if name.endswith(suffix):
+            name = name[: -len(suffix)]
+            break
+    return output_dir / f"{name}.md"
+
+
+@app.command("summarize")
+def summarize_files(
+    transcripts: list[Path] = typer.Argument(
+        ...,
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+        readable=True,
+        help="Transcript files (.txt or structured .jsonl) to summarize",
+    ),
+    output_dir: Path = typer.Option(
+        Path("output"),
+        "--output-dir",
+        "-o",
+        help="Directory for the generated minutes",
+    ),
+    simple: bool = typer.Option(
+        False,
+        "--simple",
+        help="Generate simple bullet-point summary (instead of full minutes)",
+    ),
+    compact: bool = typer.Option(
+        True,
+        "--compact/--no-compact",
+        help="Compact transcripts before summarization",
+    ),
+    workers: int = typer.Option(
+        4,
+        "--workers",
+        "-w",
+        help="Number of transcripts summarized concurrently",
+    ),
+    rpm: float = typer.Option(
+        15.0,
+        "--rpm",
+        min=1.0,
+        help="Gemini requests per minute (size it to your API quota)",
+    ),
+    max_retries: int = typer.Option(
+        5,
+        "--max-retries",
+        min=0,
+        help="Retries of rate-limited/failed Gemini requests",
+    ),
+    timeout: float = typer.Option(
+        300.0,
+        "--timeout",
+        help="Per-request timeout in seconds",
+    ),
+    hedge_after: Optional[float] = typer.Option(
+        None,
+        "--hedge-after",
+        help="Send a duplicate request when there is no response after N seconds",
+    ),
+) -> None:
+    """Generate minutes for already transcribed meetings (batch)."""
+    outputs = {path: minutes_path(output_dir, path) for path in transcripts}
+    seen: dict[Path, Path] = {}
+    for path, out in outputs.items():
+        if out.name.endswith(MarkdownSink.extension):
+            fail(f"{path}: minutes would be saved as {out}, the name of a Markdown transcript")
+            raise typer.Exit(code=1)
+        if out in seen:
+            fail(f"{seen[out]} and {path} would both be summarized into {out}, pass only one of them")
+            raise typer.Exit(code=1)
+        seen[out] = path
+
+    transport_config = TransportConfig(
+        requests_per_minute=rpm,
+        max_retries=max_retries,
+        timeout=timeout,
+        hedge_after=hedge_after,
+        max_connections=max(workers, 1) * 2,
+    )
+    try:
+        gemini_client = GeminiClient(transport_config=transport_config)
+    except ValueError as e:
+        fail(f"{e}\n\nSet GEMINI_API_KEY in .env file or environment variable.")
+        raise typer.Exit(code=1)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    def summarize_one(path: Path) -> Path:
+        if path.suffix == ".jsonl":
+            segments = list(read_jsonl_segments(path))
+            transcript = render_text(segments)
+        else:
+            transcript = path.read_text(encoding="utf-8")
+            segments = segments_from_text(transcript)
+
+        if compact:
+            transcript = compact_transcript(segments, transcript).text
+
+        if simple:
+            summary = gemini_client.generate_simple_summary(transcript)
+        else:
+            summary = gemini_client.generate_meeting_minutes(transcript)
+
+        out = outputs[path]
+        out.write_text(summary, encoding="utf-8")
+        return out
+
+    failed = 0
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        console=console,
+    ) as progress:
+        task = progress.add_task("Summarizing with Gemini AI...", total=len(transcripts))
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+            futures = {pool.submit(summarize_one, path): path for path in transcripts}
+            for future in as_completed(futures):
+                try:
+                    console.print(f"[dim]Saved to: {future.result()}[/dim]")
+                except Exception as e:
+                    failed += 1
+                    fail(f"{futures[future]}: {e}")
+                progress.update(task, advance=1)
+
+    metrics = gemini_client.transport.metrics.snapshot()
+    table = Table(title="Gemini transport")
+    table.add_column("Metric")
+    table.add_column("Value", justify="right")
+    for name, value in metrics.items():
+        table.add_row(name, f"{value:,}")
+    console.print(table)
+
+    if failed:
+        raise typer.Exit(code=1)
+    success(f"{len(transcripts)} transcripts summarized into: {output_dir}")
+
+
+@app.command("index")
+def index_archive(
+    directory: Path = typer.Argument(
+        Path("output"),
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        help="Directory with transcripts and minutes",
+    ),
+    db: Optional[Path] = typer.Option(
+        None,
+        "--db",
+        help=f"Index database (default: <directory>/{INDEX_NAME})",
+    ),
+) -> None:
+    """Update the full-text search index (only new and changed files are read)."""
+    db = db or directory / INDEX_NAME
+    with TranscriptIndex(db) as index:
+        stats = index.update(directory)
+
+    console.print(
+        f"[dim]{stats.added} added, {stats.updated} updated, "
+        f"{stats.removed} removed, {stats.unchanged} unchanged[/dim]"
+    )
+    success(f"Index updated: {db}")
+
+
+@app.command("search")
+def search_archive(
+    query: str = typer.Argument(
+        ...,
+        help='Words to find (all must match), "quoted phrase" or prefix*',
+    ),
+    db: Path = typer.Option(
+        Path("output") / INDEX_NAME,
+        "--db",
+        help="Index database (create it with `transcribe index`)",
+    ),
+    limit: int = typer.Option(
+        20,
+        "--limit",
+        "-n",
+        help="Maximum number of hits",
+    ),
+) -> None:
+    """Search indexed transcripts and minutes (diacritics-insensitive, best hits first)."""
+    if not db.exists():
+        fail(f"Index {db} not found, create it with `transcribe index`")
+        raise typer.Exit(code=1)
+
+    # Control characters as highlight markers, so the snippet can be escaped for rich
+    with TranscriptIndex(db) as index:
+        hits = index.search(query, limit=limit, highlight=("\x02", "\x03"))
+
+    if not hits:
+        console.print("[dim]No matches[/dim]")
+        return
+
+    table = Table(title=f"Search: {query}")
+    table.add_column("File")
+    table.add_column("Time", justify="right")
+    table.add_column("Offset (ms)", justify="right")
+    table.add_column("Speaker")
+    table.add_column("Text")
+    for hit in hits:
+        path = Path(hit.path)
+        if path.is_relative_to(Path.cwd()):
+            path = path.relative_to(Path.cwd())
+        table.add_row(
+            escape(str(path)),
+            format_timestamp(hit.start_ms / 1000)[:8] if hit.start_ms is not None else "",
+            str(hit.start_ms) if hit.start_ms is not None else "",
+            escape(hit.speaker or ""),
+            escape(hit.snippet)
+            .replace("\x02", "[bold yellow]")
+            .replace("\x03", "[/bold yellow]"),
+        )
+    console.print(table)
+
+
+@models_app.command("prefetch")
+def models_prefetch(
+    whisper_models: list[str] = typer.Option(
+        ["large-v3"],
+        "--model",
+        "-m",
+        help="Whisper model(s) to prefetch (repeatable)",
+    ),
+    diarization: bool = typer.Option(
+        True,
+        "--diarization/--no-diarization",
+        help="Prefetch the diarization pipeline (needs HF_TOKEN)",
+    ),
+    store: Optional[Path] = typer.Option(
+        None,
+        "--store",
+        help="Model store directory (default: CBB_MODEL_STORE or ~/.cache/cant-be-bothered/models)",
+    ),
+) -> None:
+    """Download models into the local model store and record their checksums."""
+    store = store or model_store.default_store()
+    store.mkdir(parents=True, exist_ok=True)
+    manifest = model_store.read_manifest(store)
+
+    token = os.getenv("HF_TOKEN")
+    if diarization and not token:
+        fail("HF_TOKEN is required to prefetch the diarization pipeline (or use --no-diarization)")
+        raise typer.Exit(code=1)
+
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+        ) as progress:
+            for size in whisper_models:
+                task = progress.add_task(f"Fetching Whisper {size}...", total=None)
+                manifest[model_store.whisper_key(size)] = model_store.prefetch_whisper(
+                    store, size
+                )
+                model_store.write_manifest(store, manifest)
+                progress.remove_task(task)
+                console.print(f":white_check_mark: [green]Whisper {size}[/green]")
+
+            if diarization:
+                task = progress.add_task("Fetching diarization pipeline...", total=None)
+                manifest.update(model_store.prefetch_diarization(store, token))
+                model_store.write_manifest(store, manifest)
+                progress.remove_task(task)
+                console.print(":white_check_mark: [green]Diarization pipeline[/green]")
+    except Exception as e:
+        fail(str(e))
+        raise typer.Exit(code=1)
+
+    success(f"Models stored in: {store}")
+
+
+@models_app.command("verify")
+def models_verify(
+    quick: bool = typer.Option(
+        False,
+        "--quick",
+        help="Only compare file sizes, skip checksums",
+    ),
+    store: Optional[Path] = typer.Option(
+        None,
+        "--store",
+        help="Model store directory (default: CBB_MODEL_STORE or ~/.cache/cant-be-bothered/models)",
+    ),
+) -> None:
+    """Check the local model store against its checksums."""
+    store = store or model_store.default_store()
+    problems = model_store.verify_store(store, quick=quick)
+    if problems:
+        for problem in problems:
+            fail(problem)
+        raise typer.Exit(code=1)
+    success(f"All models in {store} are intact")
+
+
+@models_app.command("list")
+def models_list(
+    store: Optional[Path] = typer.Option(
+        None,
+        "--store",
+        help="Model store directory (default: CBB_MODEL_STORE or ~/.cache/cant-be-bothered/models)",
+    ),
+) -> None:
+    """List models in the local model store."""
+    store = store or model_store.default_store()
+    manifest = model_store.read_manifest(store)
+    if not manifest:
+        console.print(f"[dim]No models in store {store}[/dim]")
+        return
+
+    table = Table(title=f"Model store: {store}")
+    table.add_column("Model")
+    table.add_column("Repository")
+    table.add_column("Files", justify="right")
+    table.add_column("Size", justify="right")
+    table.add_column("Fetched")
+    for key, model in manifest.items():
+        table.add_row(
+            key,
+            model.repo_id,
+            str(len(model.files)),
+            f"{model.size / 1024**2:,.0f} MB",
+            model.fetched_at[:19],
+        )
+    console.print(table)
+
+
 if __name__ == "__main__":
     app()
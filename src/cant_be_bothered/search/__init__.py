@@ -0,0 +1 @@
+"""Full-text search over the transcript archive."""
@@ -0,0 +1,289 @@
+"""
+Incremental full-text index of transcripts and minutes (SQLite FTS5).
+
+Every transcript segment / minutes paragraph is one indexed row with its
+speaker and time offsets. The unicode61 tokenizer strips diacritics, so
+"rozhodnutie" also finds "rozhodnútie" and vice versa.
+"""
+
+import re
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+from cant_be_bothered.summarization.compaction import segments_from_text
+from cant_be_bothered.transcription.sinks import MarkdownSink, read_jsonl_segments
+
+INDEX_NAME = ".transcript_index.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS segments (
+    id INTEGER PRIMARY KEY,
+    document_id INTEGER NOT NULL REFERENCES documents(id),
+    start_ms INTEGER,
+    end_ms INTEGER,
+    speaker TEXT
+);
+CREATE INDEX IF NOT EXISTS segments_document ON segments(document_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS segments_fts USING fts5(
+    text,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+_QUERY_TERM = re.compile(r'"([^"]*)"|(\S+)')
+_MARKDOWN_PARAGRAPH = re.compile(r"^`\[([\d:]+)\]`(?: \*\*(.+?):\*\*)? ?(.*)$", re.DOTALL)
+
+
+@dataclass
+class IndexedSegment:
+    text: str
+    start_ms: Optional[int] = None
+    end_ms: Optional[int] = None
+    speaker: Optional[str] = None
+
+
+@dataclass
+class IndexStats:
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+    unchanged: int = 0
+
+
+@dataclass
+class SearchHit:
+    path: str
+    kind: str
+    start_ms: Optional[int]
+    end_ms: Optional[int]
+    speaker: Optional[str]
+    snippet: str
+    score: float
+
+
+def _seconds_to_ms(seconds: Optional[float]) -> Optional[int]:
+    return None if seconds is None else int(round(seconds * 1000))
+
+
+def _clock_to_seconds(timestamp: str) -> float:
+    """Parse hh:mm:ss (as written by MarkdownSink) into seconds."""
+    seconds = 0.0
+    for part in timestamp.split(":"):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+
+def _read_jsonl(path: Path) -> Iterator[IndexedSegment]:
+    for segment in read_jsonl_segments(path):
+        yield IndexedSegment(
+            text=segment.text,
+            start_ms=_seconds_to_ms(segment.start),
+            end_ms=_seconds_to_ms(segment.end),
+            speaker=segment.speaker,
+        )
+
+
+def _read_text(path: Path) -> Iterator[IndexedSegment]:
+    # Plain text has speakers, but no timing
+    for segment in segments_from_text(path.read_text(encoding="utf-8")):
+        yield IndexedSegment(text=segment.text, speaker=segment.speaker)
+
+
+def _paragraphs(path: Path) -> Iterator[str]:
+    for paragraph in re.split(r"\n\s*\n", path.read_text(encoding="utf-8")):
+        paragraph = paragraph.strip()
+        if paragraph:
+            yield paragraph
+
+
+def _read_markdown_transcript(path: Path) -> Iterator[IndexedSegment]:
+    for paragraph in _paragraphs(path):
+        match = _MARKDOWN_PARAGRAPH.match(paragraph)
+        if match is None:
+            yield IndexedSegment(text=paragraph)
+            continue
+        timestamp, speaker, text = match.groups()
+        yield IndexedSegment(
+            text=text.strip(),
+            start_ms=_seconds_to_ms(_clock_to_seconds(timestamp)),
+            speaker=speaker,
+        )
+
+
+def _read_minutes(path: Path) -> Iterator[IndexedSegment]:
+    for paragraph in _paragraphs(path):
+        yield IndexedSegment(text=paragraph)
+
+
+def _document_kind(path: Path) -> Optional[str]:
+    """Kind of an archive file, None for files that are not indexed."""
+    name = path.name
+    if name.endswith(MarkdownSink.extension):
+        base = name[: -len(MarkdownSink.extension)]
+    elif path.suffix in (".txt", ".jsonl", ".md"):
+        base = path.stem
+    else:
+        return None
+
+    if path.suffix == ".jsonl":
+        return "jsonl"
+    if path.suffix == ".md" and not name.endswith(MarkdownSink.extension):
+        return "minutes"
+    # Other transcript formats are only indexed if there is no structured (.jsonl) one
+    if path.with_name(base + ".jsonl").exists():
+        return None
+    return "markdown" if path.suffix == ".md" else "text"
+
+
+_READERS = {
+    "jsonl": _read_jsonl,
+    "text": _read_text,
+    "markdown": _read_markdown_transcript,
+    "minutes": _read_minutes,
+}
+
+
+def build_match_query(query: str) -> str:
+    """
+    Turn user query into FTS5 MATCH expression.
+
+    Words are ANDed, "quoted text" is a phrase and word* is a prefix search.
+    Everything else is taken literally (no FTS5 operators/syntax errors).
+    """
+    terms = []
+    for phrase, word in _QUERY_TERM.findall(query):
+        if phrase.strip():
+            terms.append('"' + phrase.strip().replace('"', '""') + '"')
+        elif word:
+            prefix = word.endswith("*")
+            word = word.rstrip("*")
+            if word:
+                terms.append('"' + word.replace('"', '""') + '"' + ("*" if prefix else ""))
+    return " ".join(terms)
+
+
+class TranscriptIndex:
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.db_path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "TranscriptIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _remove_document(self, document_id: int) -> None:
+        self.connection.execute(
+            "DELETE FROM segments_fts WHERE rowid IN (SELECT id FROM segments WHERE document_id = ?)",
+            (document_id,),
+        )
+        self.connection.execute("DELETE FROM segments WHERE document_id = ?", (document_id,))
+        self.connection.execute("DELETE FROM documents WHERE id = ?", (document_id,))
+
+    def _add_document(self, path: Path, kind: str, size: int, mtime_ns: int) -> None:
+        cursor = self.connection.execute(
+            "INSERT INTO documents (path, kind, size, mtime_ns) VALUES (?, ?, ?, ?)",
+            (str(path), kind, size, mtime_ns),
+        )
+        document_id = cursor.lastrowid
+        for segment in _READERS[kind](path):
+            if not segment.text:
+                continue
+            cursor = self.connection.execute(
+                "INSERT INTO segments (document_id, start_ms, end_ms, speaker) VALUES (?, ?, ?, ?)",
+                (document_id, segment.start_ms, segment.end_ms, segment.speaker),
+            )
+            self.connection.execute(
+                "INSERT INTO segments_fts (rowid, text) VALUES (?, ?)",
+                (cursor.lastrowid, segment.text),
+            )
+
+    def update(self, root: Union[str, Path]) -> IndexStats:
+        """
+        Index new and changed transcripts/minutes under `root`, drop deleted ones.
+
+        Files are compared by size and modification time, unchanged files are not read.
+        """
+        root = Path(root).resolve()
+        stats = IndexStats()
+
+        known = {
+            path: (document_id, size, mtime_ns)
+            for document_id, path, size, mtime_ns in self.connection.execute(
+                "SELECT id, path, size, mtime_ns FROM documents"
+            )
+        }
+
+        with self.connection:
+            seen = set()
+            for path in sorted(root.rglob("*")):
+                if not path.is_file():
+                    continue
+                kind = _document_kind(path)
+                if kind is None:
+                    continue
+
+                key = str(path)
+                seen.add(key)
+                stat = path.stat()
+                previous = known.get(key)
+                if previous is not None:
+                    if previous[1:] == (stat.st_size, stat.st_mtime_ns):
+                        stats.unchanged += 1
+                        continue
+                    self._remove_document(previous[0])
+                    stats.updated += 1
+                else:
+                    stats.added += 1
+                self._add_document(path, kind, stat.st_size, stat.st_mtime_ns)
+
+            # Documents under root that disappeared (or are now superseded by a .jsonl)
+            for key, (document_id, _, _) in known.items():
+                if key not in seen and Path(key).is_relative_to(root):
+                    self._remove_document(document_id)
+                    stats.removed += 1
+
+        return stats
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        highlight: tuple[str, str] = ("[", "]"),
+    ) -> list[SearchHit]:
+        """Ranked (BM25) hits for `query`, see build_match_query for the query syntax."""
+        match = build_match_query(query)
+        if not match:
+            return []
+
+        rows = self.connection.execute(
+            """
+            SELECT d.path, d.kind, s.start_ms, s.end_ms, s.speaker,
+                   snippet(segments_fts, 0, ?, ?, '…', 16),
+                   bm25(segments_fts) AS score
+            FROM segments_fts
+            JOIN segments s ON s.id = segments_fts.rowid
+            JOIN documents d ON d.id = s.document_id
+            WHERE segments_fts MATCH ?
+            ORDER BY score
+            LIMIT ?
+            """,
+            (highlight[0], highlight[1], match, limit),
+        )
+        return [SearchHit(*row) for row in rows]
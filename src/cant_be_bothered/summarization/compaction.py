@@ -0,0 +1,260 @@
+"""
+Deterministic transcript compaction before the transcript is sent to the LLM.
+
+Removes what only costs tokens: Whisper repetition loops, filler words and
+transcript fragmentation (consecutive segments of the same speaker).
+Everything runs in linear time in the transcript length.
+"""
+
+import re
+import string
+from dataclasses import dataclass, field
+from itertools import compress, count, islice
+from operator import eq
+from typing import Iterable, Optional
+
+from cant_be_bothered.transcription.segments import (
+    TranscriptSegment,
+    format_speaker_label,
+)
+
+# Slovak and English filler words/phrases (matched case- and punctuation-insensitive)
+DEFAULT_FILLERS = frozenset(
+    {
+        # Slovak
+        "ehm",
+        "hm",
+        "hmm",
+        "mhm",
+        "eh",
+        "ehh",
+        "ee",
+        "eee",
+        "aaa",
+        "ééé",
+        "akože",
+        "proste",
+        # English
+        "uh",
+        "uhm",
+        "um",
+        "umm",
+        "erm",
+        "you know",
+        "i mean",
+    }
+)
+
+_PUNCTUATION = string.punctuation + "„“”‚‘’«»…–—"
+_SPEAKER_LABEL = re.compile(r"^\[([^\]\n]+)\]$", re.MULTILINE)
+
+
+@dataclass
+class CompactionConfig:
+    """
+    - fillers: words/phrases to strip (empty set disables filler removal)
+    - min_repeats: collapse a phrase repeated at least this many times in a row into one
+    - max_ngram: longest phrase (in words) checked for repetition loops
+    - max_block_seconds: merged same-speaker block never spans more than this
+    - timestamps: prefix every block with a compact [mm:ss] timestamp
+    """
+
+    fillers: frozenset[str] = field(default_factory=lambda: DEFAULT_FILLERS)
+    min_repeats: int = 3
+    max_ngram: int = 8
+    max_block_seconds: float = 120.0
+    timestamps: bool = False
+
+
+@dataclass
+class CompactionResult:
+    text: str
+    original_tokens: int
+    compacted_tokens: int
+
+    @property
+    def reduction(self) -> float:
+        """Relative token reduction (0.25 = 25% fewer tokens)."""
+        if not self.original_tokens:
+            return 0.0
+        return 1 - self.compacted_tokens / self.original_tokens
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token estimate (~4 characters per token), good enough to compare two texts.
+    Use GeminiClient.count_tokens for the exact number.
+    """
+    return (len(text) + 3) // 4
+
+
+def format_compact_timestamp(seconds: float) -> str:
+    """Format seconds as m:ss, or h:mm:ss for recordings longer than an hour."""
+    seconds = int(seconds)
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
+
+
+def segments_from_text(text: str) -> list[TranscriptSegment]:
+    """
+    Parse plain-text transcript (as written by TextSink) back into segments.
+
+    Plain text has no timing information, so all segments start at 0.
+    """
+    segments = []
+    speaker = None
+    position = 0
+    for match in _SPEAKER_LABEL.finditer(text):
+        chunk = text[position : match.start()].strip()
+        if chunk:
+            segments.append(TranscriptSegment(0.0, 0.0, chunk, speaker))
+        speaker = match.group(1)
+        position = match.end()
+
+    chunk = text[position:].strip()
+    if chunk:
+        segments.append(TranscriptSegment(0.0, 0.0, chunk, speaker))
+    return segments
+
+
+def _normalize(word: str) -> str:
+    return word.lower().strip(_PUNCTUATION)
+
+
+def _strip_fillers(
+    words: list[str], keys: list[str], fillers: set[tuple[str, ...]], max_len: int
+) -> tuple[list[str], list[str]]:
+    first_words = {filler[0] for filler in fillers}
+    candidates = [i for i, key in enumerate(keys) if key in first_words]
+    if not candidates:
+        return words, keys
+
+    out_words, out_keys = [], []
+    copied = 0  # words before this index are already handled
+    for i in candidates:
+        if i < copied:
+            continue
+        for length in range(min(max_len, len(keys) - i), 0, -1):
+            if tuple(keys[i : i + length]) in fillers:
+                out_words.extend(words[copied:i])
+                out_keys.extend(keys[copied:i])
+                copied = i + length
+                break
+
+    out_words.extend(words[copied:])
+    out_keys.extend(keys[copied:])
+    return out_words, out_keys
+
+
+def _collapse_repeats(
+    words: list[str], keys: list[str], n: int, min_repeats: int
+) -> tuple[list[str], list[str]]:
+    """Collapse runs of the same n-word phrase repeated >= min_repeats times into one copy."""
+    # A phrase can only repeat where its first word does - find those spots at C speed
+    candidates = list(compress(count(), map(eq, keys, islice(keys, n, None))))
+    if not candidates:
+        return words, keys
+
+    out_words, out_keys = [], []
+    total = len(keys)
+    copied = 0  # words before this index are already handled
+    for i in candidates:
+        if i < copied:
+            continue
+        phrase = keys[i : i + n]
+        if not any(phrase):
+            continue
+
+        end = i + n
+        while end + n <= total and keys[end : end + n] == phrase:
+            end += n
+
+        if (end - i) // n >= min_repeats:
+            out_words.extend(words[copied : i + n - 1])
+            out_keys.extend(keys[copied : i + n])
+            # First copy keeps its casing, the last one its closing punctuation ("ok, ok, ok." -> "ok.")
+            last = words[end - 1]
+            out_words.append(
+                words[i + n - 1].rstrip(_PUNCTUATION) + last[len(last.rstrip(_PUNCTUATION)) :]
+            )
+            copied = end
+
+    out_words.extend(words[copied:])
+    out_keys.extend(keys[copied:])
+    return out_words, out_keys
+
+
+def _merge_blocks(
+    segments: Iterable[TranscriptSegment], max_block_seconds: float
+) -> list[tuple[float, Optional[str], list[str]]]:
+    """Merge consecutive same-speaker segments, dropping exact consecutive duplicates."""
+    blocks: list[tuple[float, Optional[str], list[str]]] = []
+    previous_key = None
+    for segment in segments:
+        key = (segment.speaker, _normalize(segment.text))
+        if not key[1] or key == previous_key:
+            continue  # empty segment or Whisper repeating the previous segment
+        previous_key = key
+
+        if (
+            blocks
+            and blocks[-1][1] == segment.speaker
+            and segment.start - blocks[-1][0] < max_block_seconds
+        ):
+            blocks[-1][2].append(segment.text)
+        else:
+            blocks.append((segment.start, segment.speaker, [segment.text]))
+    return blocks
+
+
+def compact_segments(
+    segments: Iterable[TranscriptSegment],
+    config: Optional[CompactionConfig] = None,
+) -> str:
+    """Compact transcript segments into plain-text transcript for the LLM."""
+    config = config or CompactionConfig()
+    fillers = {tuple(_normalize(w) for w in f.split()) for f in config.fillers}
+    max_filler_len = max((len(f) for f in fillers), default=0)
+
+    parts = []
+    current_speaker = None
+    for start, speaker, texts in _merge_blocks(segments, config.max_block_seconds):
+        text = " ".join(texts)
+        words = text.split()
+        keys = [key.strip(_PUNCTUATION) for key in text.lower().split()]
+
+        if fillers:
+            words, keys = _strip_fillers(words, keys, fillers, max_filler_len)
+        for n in range(1, config.max_ngram + 1):
+            words, keys = _collapse_repeats(words, keys, n, config.min_repeats)
+        if not words:
+            continue
+
+        if speaker is not None and speaker != current_speaker:
+            current_speaker = speaker
+            parts.append(format_speaker_label(speaker, template="\n\n[{}]\n"))
+        elif parts:
+            parts.append("\n")
+
+        if config.timestamps:
+            parts.append(f"[{format_compact_timestamp(start)}] ")
+        parts.append(" ".join(words))
+
+    return "".join(parts).strip()
+
+
+def compact_transcript(
+    segments: list[TranscriptSegment],
+    original_text: str,
+    config: Optional[CompactionConfig] = None,
+) -> CompactionResult:
+    """Compact transcript and report the (estimated) token reduction against `original_text`."""
+    text = compact_segments(segments, config)
+    return CompactionResult(
+        text=text,
+        original_tokens=estimate_tokens(original_text),
+        compacted_tokens=estimate_tokens(text),
+    )
@@ -1,65 +1,101 @@
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
 
-from google import genai
+from google.genai import errors, types
 from dotenv import load_dotenv
 
 from cant_be_bothered.summarization.prompts import (
     MEETING_MINUTES_PROMPT,
+    MEETING_MINUTES_VARIANT,
     SIMPLE_SUMMARY_PROMPT,
+    SIMPLE_SUMMARY_VARIANT,
     SYSTEM_PROMPT,
+    TRANSCRIPT_BLOCK,
 )
+from cant_be_bothered.summarization.transport import GeminiTransport, TransportConfig
 
 load_dotenv()
 
+# How long an uploaded transcript stays cached, if it is not deleted explicitly
+CACHE_TTL_SECONDS = 600
+
+
+@dataclass
+class TokenUsage:
+    """Token usage accumulated over all requests of one client."""
+
+    requests: int = 0
+    prompt_tokens: int = 0
+    cached_tokens: int = 0
+    output_tokens: int = 0
+
 
 class GeminiClient:
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        transport_config: Optional[TransportConfig] = None,
+    ):
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         if not self.api_key:
             raise ValueError(
                 "Gemini API key not found. Set GEMINI_API_KEY environment variable or pass it to constructor."
             )
 
-        self.client = genai.Client(api_key=self.api_key)
+        # base_url allows pointing the client to a proxy or a local stub server
+        base_url = base_url or os.getenv("GEMINI_BASE_URL")
+        # Rate limiting, retries and the shared connection pool live in the transport
+        self.transport = GeminiTransport(self.api_key, base_url, transport_config)
+        self.client = self.transport.client
         self.model_name = "gemini-2.0-flash-exp"
 
+        self.usage = TokenUsage()
+        self._usage_lock = threading.Lock()
+
+    def _generate(self, prompt: str, cached_content: Optional[str] = None) -> str:
+        config = {"temperature": 0.3}
+        if cached_content is not None:
+            # System prompt is part of the cached content
+            config["cached_content"] = cached_content
+        else:
+            config["system_instruction"] = SYSTEM_PROMPT
+
+        response = self.transport.generate_content(
+            model=self.model_name,
+            contents=prompt,
+            config=config,
+        )
+
+        metadata = response.usage_metadata
+        if metadata is not None:
+            with self._usage_lock:
+                self.usage.requests += 1
+                self.usage.prompt_tokens += metadata.prompt_token_count or 0
+                self.usage.cached_tokens += metadata.cached_content_token_count or 0
+                self.usage.output_tokens += metadata.candidates_token_count or 0
+
+        return response.text
+
     def generate_meeting_minutes(
         self,
         transcript: str,
         date: Optional[str] = None,
     ) -> str:
-        if date is None:
-            date = datetime.now().strftime("%d. %B %Y")
-
         prompt = MEETING_MINUTES_PROMPT.format(
             transcript=transcript,
-            date=date,
-        )
-
-        response = self.client.models.generate_content(
-            model=self.model_name,
-            contents=prompt,
-            config={
-                "system_instruction": SYSTEM_PROMPT,
-                "temperature": 0.3,
-            },
+            date=date or self._today(),
         )
-        return response.text
+        return self._generate(prompt)
 
     def generate_simple_summary(self, transcript: str) -> str:
         prompt = SIMPLE_SUMMARY_PROMPT.format(transcript=transcript)
-
-        response = self.client.models.generate_content(
-            model=self.model_name,
-            contents=prompt,
-            config={
-                "system_instruction": SYSTEM_PROMPT,
-                "temperature": 0.3,
-            },
-        )
-        return response.text
+        return self._generate(prompt)
 
     def generate_custom_summary(
         self,
@@ -67,20 +103,110 @@ class GeminiClient:
         custom_instructions: str,
     ) -> str:
         prompt = f"{custom_instructions}\n\nPREPIS:\n{transcript}"
+        return self._generate(prompt)
 
-        response = self.client.models.generate_content(
-            model=self.model_name,
-            contents=prompt,
-            config={
-                "system_instruction": SYSTEM_PROMPT,
-                "temperature": 0.3,
-            },
+    def meeting_minutes_variant(self, date: Optional[str] = None) -> str:
+        """Meeting minutes instructions for generate_outputs."""
+        return MEETING_MINUTES_VARIANT.format(date=date or self._today())
+
+    def simple_summary_variant(self) -> str:
+        """Simple summary instructions for generate_outputs."""
+        return SIMPLE_SUMMARY_VARIANT
+
+    @contextmanager
+    def cached_transcript(
+        self,
+        transcript: str,
+        ttl: int = CACHE_TTL_SECONDS,
+    ) -> Iterator[Optional[str]]:
+        """
+        Upload transcript together with the system prompt as cached context.
+
+        Yields the cache name, or None if the model/transcript cannot be cached
+        (e.g. the transcript is below the minimal cacheable size).
+        The cache is deleted on exit, `ttl` is only a safety net if that fails.
+        """
+        try:
+            cache = self.transport.call(
+                lambda client: client.caches.create(
+                    model=self.model_name,
+                    config=types.CreateCachedContentConfig(
+                        contents=[TRANSCRIPT_BLOCK.format(transcript=transcript)],
+                        system_instruction=SYSTEM_PROMPT,
+                        ttl=f"{ttl}s",
+                    ),
+                ),
+                hedge=False,
+            )
+        except errors.APIError:
+            cache = None
+
+        if cache is None:
+            yield None
+            return
+
+        try:
+            yield cache.name
+        finally:
+            try:
+                self.transport.call(
+                    lambda client: client.caches.delete(name=cache.name), hedge=False
+                )
+            except errors.APIError:
+                pass  # expires on its own after ttl
+
+    def generate_outputs(
+        self,
+        transcript: str,
+        variants: dict[str, str],
+        use_cache: bool = True,
+        max_workers: int = 4,
+    ) -> dict[str, str]:
+        """
+        Generate several outputs (minutes, summaries, custom variants) from one transcript.
+
+        The transcript is uploaded once as cached context and all variants run
+        concurrently against it. If caching is not available, every request
+        starts with the same transcript prefix instead, so the API can still
+        reuse it implicitly.
+
+        - variants: output name -> instructions without the transcript
+          (see meeting_minutes_variant, simple_summary_variant)
+
+        Returns output name -> generated text, in the order of `variants`.
+        """
+        if not variants:
+            return {}
+
+        cache_context = (
+            self.cached_transcript(transcript) if use_cache else nullcontext(None)
         )
-        return response.text
+        with cache_context as cache_name:
+            prefix = TRANSCRIPT_BLOCK.format(transcript=transcript) + "\n\n---\n\n"
+
+            def run(instructions: str) -> str:
+                if cache_name is not None:
+                    return self._generate(instructions, cached_content=cache_name)
+                return self._generate(prefix + instructions)
+
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(max_workers, len(variants)))
+            ) as pool:
+                futures = {
+                    name: pool.submit(run, instructions)
+                    for name, instructions in variants.items()
+                }
+                return {name: future.result() for name, future in futures.items()}
 
     def count_tokens(self, text: str) -> int:
-        response = self.client.models.count_tokens(
-            model=self.model_name,
-            contents=text,
+        response = self.transport.call(
+            lambda client: client.models.count_tokens(
+                model=self.model_name,
+                contents=text,
+            )
         )
         return response.total_tokens
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.now().strftime("%d. %B %Y")
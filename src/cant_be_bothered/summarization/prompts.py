@@ -9,14 +9,12 @@ Tvoja úloha:
 Štýl: Formálny, stručný, faktografický, bez emoji a neformálnych prvkov."""
 
 
-MEETING_MINUTES_PROMPT = """Na základe nasledujúceho prepisu stretnutia vytvor profesionálnu zápisnicu v slovenčine.
+# Transcript part of the prompts - kept separate, so it can be uploaded once as cached context
+TRANSCRIPT_BLOCK = """# PREPIS STRETNUTIA:
+{transcript}"""
 
-# PREPIS STRETNUTIA:
-{transcript}
-
----
 
-# POŽADOVANÝ FORMÁT ZÁPISNICE:
+MEETING_MINUTES_INSTRUCTIONS = """# POŽADOVANÝ FORMÁT ZÁPISNICE:
 
 # Zápisnica - [Názov/Téma stretnutia]
 
@@ -78,6 +76,21 @@ DÔLEŽITÉ POKYNY:
 Vytvor zápisnicu:"""
 
 
+MEETING_MINUTES_PROMPT = (
+    "Na základe nasledujúceho prepisu stretnutia vytvor profesionálnu zápisnicu v slovenčine.\n\n"
+    + TRANSCRIPT_BLOCK
+    + "\n\n---\n\n"
+    + MEETING_MINUTES_INSTRUCTIONS
+)
+
+
+# Variant of MEETING_MINUTES_PROMPT for when the transcript is already in the (cached) context
+MEETING_MINUTES_VARIANT = (
+    "Na základe prepisu stretnutia vytvor profesionálnu zápisnicu v slovenčine.\n\n"
+    + MEETING_MINUTES_INSTRUCTIONS
+)
+
+
 SIMPLE_SUMMARY_PROMPT = """Zhrň tento prepis stretnutia do 5-7 kľúčových bodov v slovenčine v profesionálnom štýle:
 
 {transcript}
@@ -89,3 +102,15 @@ Formát (bez emoji):
 ...
 
 Buď stručný a faktografický."""
+
+
+# Variant of SIMPLE_SUMMARY_PROMPT for when the transcript is already in the (cached) context
+SIMPLE_SUMMARY_VARIANT = """Zhrň prepis stretnutia do 5-7 kľúčových bodov v slovenčine v profesionálnom štýle.
+
+Formát (bez emoji):
+- Bod 1
+- Bod 2
+- Bod 3
+...
+
+Buď stručný a faktografický."""
@@ -0,0 +1,311 @@
+"""
+Resilient transport for Gemini API calls.
+
+All GeminiClients with the same settings share one genai.Client (and so one
+HTTP connection pool), one rate limiter and one hedging thread pool. Every
+call goes through the token bucket, is retried with jittered exponential
+backoff on transient errors (429, 5xx, timeouts) and can optionally be
+hedged - a duplicate request is sent when the first one is slow, and
+whichever finishes first wins.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Optional, TypeVar
+
+import httpx
+from google import genai
+from google.genai import errors, types
+
+T = TypeVar("T")
+
+# HTTP status codes worth retrying
+TRANSIENT_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+@dataclass
+class TransportConfig:
+    """
+    - requests_per_minute: sustained request rate (size it to your quota)
+    - burst: how many requests may go out at once after an idle period
+    - max_retries: retries of a transient error before giving up
+    - backoff_base / backoff_max: exponential backoff bounds in seconds (full jitter)
+    - timeout: per-request timeout in seconds
+    - hedge_after: send a duplicate request after this many seconds without
+      a response (None disables hedging)
+    - max_connections: size of the shared HTTP connection pool
+    """
+
+    requests_per_minute: float = 15.0
+    burst: int = 4
+    max_retries: int = 5
+    backoff_base: float = 1.0
+    backoff_max: float = 60.0
+    timeout: float = 300.0
+    hedge_after: Optional[float] = None
+    max_connections: int = 16
+
+    def __post_init__(self):
+        if self.requests_per_minute <= 0:
+            raise ValueError(f"requests_per_minute must be positive, got {self.requests_per_minute}")
+        if self.burst < 1:
+            raise ValueError(f"burst must be at least 1, got {self.burst}")
+        if self.max_retries < 0:
+            raise ValueError(f"max_retries must not be negative, got {self.max_retries}")
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket - `rate` tokens per second, at most `capacity` stored.
+
+    Raises
+    - ValueError: if rate is not positive or capacity is less than 1
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        if rate <= 0 or capacity < 1:
+            raise ValueError(f"Invalid token bucket: rate={rate}, capacity={capacity}")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def acquire(self) -> float:
+        """Block until a token is available, returns the time spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class TransportMetrics:
+    """Latency and error counters of a transport (thread-safe)."""
+
+    def __init__(self, window: int = 1000):
+        self.requests = 0
+        self.successes = 0
+        self.failures = 0
+        self.retries = 0
+        self.hedges = 0
+        self.rate_limited = 0
+        self.timeouts = 0
+        self.throttled_seconds = 0.0
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record_success(self, latency: float) -> None:
+        with self._lock:
+            self.requests += 1
+            self.successes += 1
+            self._latencies.append(latency)
+
+    def record_failure(self, error: Exception) -> None:
+        with self._lock:
+            self.requests += 1
+            self.failures += 1
+            if isinstance(error, errors.APIError) and error.code == 429:
+                self.rate_limited += 1
+            elif isinstance(error, httpx.TimeoutException):
+                self.timeouts += 1
+
+    def record(self, **counters: float) -> None:
+        with self._lock:
+            for name, value in counters.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def snapshot(self) -> dict[str, float]:
+        """Current counters plus latency percentiles (seconds) of the recent successful requests."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            result = {
+                "requests": self.requests,
+                "successes": self.successes,
+                "failures": self.failures,
+                "retries": self.retries,
+                "hedges": self.hedges,
+                "rate_limited": self.rate_limited,
+                "timeouts": self.timeouts,
+                "throttled_seconds": round(self.throttled_seconds, 3),
+            }
+
+        for name, q in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+            result[f"latency_{name}"] = (
+                round(latencies[min(len(latencies) - 1, int(q * len(latencies)))], 3)
+                if latencies
+                else 0.0
+            )
+        return result
+
+
+_shared_clients: dict[tuple, genai.Client] = {}
+_shared_buckets: dict[tuple, TokenBucket] = {}
+_shared_hedge_pools: dict[int, ThreadPoolExecutor] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_client(
+    api_key: str,
+    base_url: Optional[str],
+    timeout: float,
+    max_connections: int,
+) -> genai.Client:
+    """genai.Client shared by all transports with the same settings (one connection pool)."""
+    key = (api_key, base_url, timeout, max_connections)
+    with _shared_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = genai.Client(
+                api_key=api_key,
+                http_options=types.HttpOptions(
+                    base_url=base_url,
+                    timeout=int(timeout * 1000),  # milliseconds
+                    client_args={
+                        "limits": httpx.Limits(
+                            max_connections=max_connections,
+                            max_keepalive_connections=max_connections,
+                        )
+                    },
+                ),
+            )
+            _shared_clients[key] = client
+        return client
+
+
+def shared_bucket(api_key: str, requests_per_minute: float, burst: int) -> TokenBucket:
+    """Rate limiter shared by all transports using the same API key (and so the same quota)."""
+    key = (api_key, requests_per_minute, burst)
+    with _shared_lock:
+        bucket = _shared_buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(rate=requests_per_minute / 60.0, capacity=burst)
+            _shared_buckets[key] = bucket
+        return bucket
+
+
+def shared_hedge_pool(max_workers: int) -> ThreadPoolExecutor:
+    """Thread pool for hedged requests, shared by all transports with the same pool size."""
+    with _shared_lock:
+        pool = _shared_hedge_pools.get(max_workers)
+        if pool is None:
+            pool = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="gemini-hedge"
+            )
+            _shared_hedge_pools[max_workers] = pool
+        return pool
+
+
+def is_transient(error: Exception) -> bool:
+    if isinstance(error, errors.APIError):
+        return error.code in TRANSIENT_STATUS_CODES
+    return isinstance(error, (httpx.TimeoutException, httpx.TransportError))
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Delay requested by the server in the Retry-After header, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class GeminiTransport:
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        config: Optional[TransportConfig] = None,
+    ):
+        self.config = config or TransportConfig()
+        self.client = shared_client(
+            api_key, base_url, self.config.timeout, self.config.max_connections
+        )
+        self.bucket = shared_bucket(
+            api_key, self.config.requests_per_minute, self.config.burst
+        )
+        self.metrics = TransportMetrics()
+        self._hedge_pool: Optional[ThreadPoolExecutor] = None
+        if self.config.hedge_after is not None:
+            self._hedge_pool = shared_hedge_pool(self.config.max_connections)
+
+    def call(self, request: Callable[[genai.Client], T], hedge: bool = True) -> T:
+        """
+        Run `request(client)` with rate limiting, retries and (optionally) hedging.
+
+        - hedge: allow hedging - only for idempotent requests
+
+        Raises the last error if the request fails permanently or retries run out.
+        """
+        attempt = 0
+        while True:
+            self.metrics.record(throttled_seconds=self.bucket.acquire())
+            started = time.monotonic()
+            try:
+                if hedge and self._hedge_pool is not None:
+                    result = self._hedged(request)
+                else:
+                    result = request(self.client)
+            except Exception as e:
+                self.metrics.record_failure(e)
+                if not is_transient(e) or attempt == self.config.max_retries:
+                    raise
+
+                delay = random.uniform(
+                    0, min(self.config.backoff_max, self.config.backoff_base * 2**attempt)
+                )
+                delay = max(delay, _retry_after(e) or 0.0)
+                self.metrics.record(retries=1)
+                time.sleep(delay)
+                attempt += 1
+            else:
+                self.metrics.record_success(time.monotonic() - started)
+                return result
+
+    def _hedged(self, request: Callable[[genai.Client], T]) -> T:
+        primary = self._hedge_pool.submit(request, self.client)
+        done, _ = wait([primary], timeout=self.config.hedge_after)
+        # Hedge only if the primary is slow and it does not exceed the rate limit
+        if done or not self.bucket.try_acquire():
+            return primary.result()
+
+        self.metrics.record(hedges=1)
+        pending = {primary, self._hedge_pool.submit(request, self.client)}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    # The slower request cannot be cancelled, it finishes in background
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    def generate_content(self, hedge: bool = True, **kwargs) -> types.GenerateContentResponse:
+        return self.call(lambda client: client.models.generate_content(**kwargs), hedge=hedge)
@@ -0,0 +1,302 @@
+"""
+Local model store - Whisper and diarization models prefetched into one directory.
+
+The store is a Hugging Face cache directory plus a manifest with checksums.
+When it is populated, models are loaded only from it and Hugging Face Hub is
+switched to offline mode, so a run never touches the network.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Union
+
+import torch
+from faster_whisper import WhisperModel
+from faster_whisper.utils import download_model
+from huggingface_hub import constants as hf_constants
+from huggingface_hub import snapshot_download
+from pyannote.audio import Pipeline
+
+DIARIZATION_PIPELINE = "pyannote/speaker-diarization-3.1"
+# Hub repositories the diarization pipeline loads its sub-models from
+DIARIZATION_DEPENDENCIES = (
+    "pyannote/segmentation-3.0",
+    "pyannote/wespeaker-voxceleb-resnet34-LM",
+)
+
+MANIFEST_NAME = "manifest.json"
+HASH_CHUNK_SIZE = 8 * 1024 * 1024
+
+_load_lock = threading.Lock()
+
+
+def default_store() -> Path:
+    """Model store location - CBB_MODEL_STORE or ~/.cache/cant-be-bothered/models."""
+    return Path(
+        os.getenv(
+            "CBB_MODEL_STORE",
+            Path.home() / ".cache" / "cant-be-bothered" / "models",
+        )
+    )
+
+
+@dataclass
+class StoredFile:
+    size: int
+    sha256: str
+
+
+@dataclass
+class StoredModel:
+    repo_id: str
+    fetched_at: str
+    files: dict[str, StoredFile] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        return sum(f.size for f in self.files.values())
+
+
+def whisper_key(model_size: str) -> str:
+    return f"whisper:{model_size}"
+
+
+def read_manifest(store: Path) -> dict[str, StoredModel]:
+    """Read manifest of the store, returns empty dict for an empty/missing store."""
+    path = store / MANIFEST_NAME
+    if not path.exists():
+        return {}
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {
+        key: StoredModel(
+            repo_id=entry["repo_id"],
+            fetched_at=entry["fetched_at"],
+            files={name: StoredFile(**f) for name, f in entry["files"].items()},
+        )
+        for key, entry in data.get("models", {}).items()
+    }
+
+
+def write_manifest(store: Path, models: dict[str, StoredModel]) -> None:
+    path = store / MANIFEST_NAME
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(
+        json.dumps(
+            {"models": {key: asdict(model) for key, model in models.items()}},
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+    tmp.replace(path)
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _describe_snapshot(store: Path, repo_id: str, snapshot: Path) -> StoredModel:
+    model = StoredModel(repo_id=repo_id, fetched_at=datetime.now().isoformat())
+    for path in sorted(snapshot.rglob("*")):
+        if path.is_file():
+            model.files[str(path.relative_to(store))] = StoredFile(
+                size=path.stat().st_size,
+                sha256=file_sha256(path),
+            )
+    return model
+
+
+def missing_models(
+    store: Path, model_size: str, diarization: bool = False
+) -> list[str]:
+    """Manifest keys of the models a run needs that are not in the store."""
+    manifest = read_manifest(store)
+    required = [whisper_key(model_size)]
+    if diarization:
+        required.extend((DIARIZATION_PIPELINE, *DIARIZATION_DEPENDENCIES))
+    return [key for key in required if key not in manifest]
+
+
+def use_local_store(
+    model_size: str, diarization: bool = False, store: Optional[Path] = None
+) -> bool:
+    """
+    Point Hugging Face Hub to the model store and switch it offline,
+    if the store contains every model the run needs.
+
+    Otherwise Hugging Face settings are left alone, so missing models are
+    downloaded (or taken from the regular Hugging Face cache) as usual.
+
+    Returns True if the store is used.
+    """
+    store = store or default_store()
+    if missing_models(store, model_size, diarization):
+        return False
+
+    cache = str(store / "hub")
+    # Environment for child processes, constants for the already imported huggingface_hub
+    os.environ["HF_HUB_CACHE"] = cache
+    os.environ["HF_HUB_OFFLINE"] = "1"
+    hf_constants.HF_HUB_CACHE = cache
+    hf_constants.HF_HUB_OFFLINE = True
+    return True
+
+
+def prefetch_whisper(store: Path, model_size: str) -> StoredModel:
+    """Download Whisper model into the store, returns its manifest entry."""
+    snapshot = Path(download_model(model_size, cache_dir=str(store / "hub")))
+    # Hub cache layout: models--<org>--<name>/snapshots/<revision>
+    repo_id = snapshot.parent.parent.name.removeprefix("models--").replace("--", "/")
+    return _describe_snapshot(store, repo_id, snapshot)
+
+
+def prefetch_diarization(store: Path, token: Optional[str]) -> dict[str, StoredModel]:
+    """Download diarization pipeline (with its sub-models) into the store."""
+    models = {}
+    for repo_id in (DIARIZATION_PIPELINE, *DIARIZATION_DEPENDENCIES):
+        snapshot = Path(
+            snapshot_download(repo_id, cache_dir=str(store / "hub"), token=token)
+        )
+        models[repo_id] = _describe_snapshot(store, repo_id, snapshot)
+    return models
+
+
+def prefetch(
+    store: Path, whisper_models: list[str], token: Optional[str] = None
+) -> dict[str, StoredModel]:
+    """
+    Download Whisper models into the store and update its manifest.
+
+    - token: Hugging Face token - the diarization pipeline is prefetched only when given
+    """
+    store.mkdir(parents=True, exist_ok=True)
+    manifest = read_manifest(store)
+    for size in whisper_models:
+        manifest[whisper_key(size)] = prefetch_whisper(store, size)
+        write_manifest(store, manifest)
+    if token:
+        manifest.update(prefetch_diarization(store, token))
+        write_manifest(store, manifest)
+    return manifest
+
+
+def verify_store(store: Path, quick: bool = False) -> list[str]:
+    """
+    Check all files of the store against the manifest.
+
+    - quick: only compare file sizes, skip checksums
+
+    Returns list of problems (empty if the store is fine).
+    """
+    models = read_manifest(store)
+    if not models:
+        return [f"No models in store {store}"]
+
+    problems = []
+    for key, model in models.items():
+        for name, expected in model.files.items():
+            path = store / name
+            if not path.is_file():
+                problems.append(f"{key}: missing {name}")
+            elif path.stat().st_size != expected.size:
+                problems.append(f"{key}: size mismatch {name}")
+            elif not quick and file_sha256(path) != expected.sha256:
+                problems.append(f"{key}: checksum mismatch {name}")
+    return problems
+
+
+def _advise_willneed(store: Path, model: StoredModel) -> None:
+    """Ask the kernel to start reading model files into page cache ahead of the load."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for name in model.files:
+        try:
+            fd = os.open(store / name, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+
+
+def load_whisper_model(
+    model_size: str,
+    device: str,
+    compute_type: str,
+    store: Optional[Union[str, Path]] = None,
+    num_workers: int = 1,
+):
+    """
+    Load Whisper model, from the store if it contains it.
+
+    Loaded models are cached per process, so repeated transcriptions
+    (e.g. in watch mode) share one model instance.
+
+    - num_workers: how many transcriptions the model runs in parallel when it is
+      called from several threads (with 1 concurrent calls run one at a time)
+    """
+    # Lock makes concurrent callers wait for one load instead of loading twice
+    with _load_lock:
+        return _load_whisper_model(model_size, device, compute_type, store, num_workers)
+
+
+def load_diarization_pipeline(device: str, token: Optional[str] = None):
+    """Load diarization pipeline (from the store, if use_local_store activated it)."""
+    with _load_lock:
+        return _load_diarization_pipeline(device, token)
+
+
+@lru_cache(maxsize=None)
+def _load_whisper_model(
+    model_size: str,
+    device: str,
+    compute_type: str,
+    store: Optional[Union[str, Path]],
+    num_workers: int,
+):
+    store = Path(store) if store is not None else default_store()
+    stored = read_manifest(store).get(whisper_key(model_size))
+    if stored is None:
+        # Will download on first run
+        return WhisperModel(
+            model_size,
+            device=device,
+            compute_type=compute_type,
+            num_workers=num_workers,
+        )
+
+    _advise_willneed(store, stored)
+    return WhisperModel(
+        model_size,
+        device=device,
+        compute_type=compute_type,
+        download_root=str(store / "hub"),
+        local_files_only=True,
+        num_workers=num_workers,
+    )
+
+
+@lru_cache(maxsize=None)
+def _load_diarization_pipeline(device: str, token: Optional[str]):
+    pipeline = Pipeline.from_pretrained(DIARIZATION_PIPELINE, token=token)
+    pipeline.to(torch.device(device))
+    return pipeline
+
+
+if __name__ == "__main__":
+    # Used by the Docker build, which only copies this module (keeps the model layer cached):
+    #   python -m cant_be_bothered.transcription.models large-v3
+    import sys
+
+    prefetch(default_store(), sys.argv[1:], token=os.getenv("HF_TOKEN") or None)
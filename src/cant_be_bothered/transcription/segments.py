@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class TranscriptSegment:
+    """Single transcribed segment with timing (in seconds) and optional speaker."""
+
+    start: float
+    end: float
+    text: str
+    speaker: Optional[str] = None
+
+
+def format_speaker_label(speaker_id: str, template: str = "\n\n[{}]\n") -> str:
+    """Format speaker label for transcript.
+
+    This function is here for future, because different LLMs might work better with different speaker label formats.
+    For example, some studies show that using Markdown format might improve model performance.
+    """
+    return template.format(speaker_id)
+
+
+def format_timestamp(seconds: float, separator: str = ".") -> str:
+    """
+    Format seconds as hh:mm:ss<separator>mmm (SRT uses ',', WebVTT uses '.').
+    """
+    millis = max(0, int(round(seconds * 1000)))
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{millis:03d}"
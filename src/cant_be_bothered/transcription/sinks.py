@@ -0,0 +1,347 @@
+"""
+Output sinks consuming the stream of transcribed segments.
+
+Every sink receives segments one by one as Whisper produces them, so several
+formats can be written at once without keeping the whole transcript in memory.
+"""
+
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+from cant_be_bothered.transcription.segments import (
+    TranscriptSegment,
+    format_speaker_label,
+    format_timestamp,
+)
+
+
+@dataclass
+class FlushPolicy:
+    """
+    How often file sinks push buffered data to disk.
+
+    - interval: flush at most every `interval` seconds (0 = after every segment)
+    - max_bytes: flush as soon as this many bytes are pending (0 = no byte limit)
+    - fsync: also fsync the file on every flush, so data survives a power loss
+    """
+
+    interval: float = 2.0
+    max_bytes: int = 64 * 1024
+    fsync: bool = False
+
+
+class OutputSink(ABC):
+    """Base class for anything that consumes transcript segments."""
+
+    @abstractmethod
+    def write(self, segment: TranscriptSegment) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "OutputSink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class FileSink(OutputSink):
+    """
+    Sink writing rendered segments into a file, flushing according to FlushPolicy.
+
+    With append=True an existing file is extended instead of overwritten
+    (subclasses pick up where the previous run stopped in `_resume`).
+    """
+
+    extension = ".txt"
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        flush_policy: Optional[FlushPolicy] = None,
+        append: bool = False,
+    ):
+        self.path = Path(path)
+        self.flush_policy = flush_policy or FlushPolicy()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        resume = append and self.path.exists() and self.path.stat().st_size > 0
+        if resume:
+            self._resume()
+
+        self._file = open(self.path, "a" if append else "w", encoding="utf-8")
+        self._pending_bytes = 0
+        self._last_flush = time.monotonic()
+
+        if not resume:
+            self._start()
+
+    @abstractmethod
+    def render(self, segment: TranscriptSegment) -> str:
+        pass
+
+    def _start(self) -> None:
+        """Write a header into a fresh file."""
+
+    def _resume(self) -> None:
+        """Restore state from an existing file before appending to it."""
+
+    def _emit(self, text: str) -> None:
+        self._file.write(text)
+        self._pending_bytes += len(text.encode("utf-8"))
+
+    def write(self, segment: TranscriptSegment) -> None:
+        self._emit(self.render(segment))
+
+        policy = self.flush_policy
+        if (policy.max_bytes and self._pending_bytes >= policy.max_bytes) or (
+            time.monotonic() - self._last_flush >= policy.interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending_bytes:
+            self._file.flush()
+            if self.flush_policy.fsync:
+                os.fsync(self._file.fileno())
+            self._pending_bytes = 0
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+
+
+def render_text_segment(
+    segment: TranscriptSegment, current_speaker: Optional[str]
+) -> tuple[str, Optional[str]]:
+    """
+    Render segment in the plain-text transcript format.
+
+    Returns the rendered text and the speaker that is current after this segment.
+    """
+    text = ""
+    if segment.speaker is not None and segment.speaker != current_speaker:
+        current_speaker = segment.speaker
+        text = format_speaker_label(current_speaker, template="\n\n[{}]\n")
+    return text + segment.text + " ", current_speaker
+
+
+class TextSink(FileSink):
+    """Plain text transcript with a speaker label on every speaker change."""
+
+    extension = ".txt"
+
+    def __init__(self, *args, **kwargs):
+        self._speaker: Optional[str] = None
+        super().__init__(*args, **kwargs)
+
+    def render(self, segment: TranscriptSegment) -> str:
+        text, self._speaker = render_text_segment(segment, self._speaker)
+        return text
+
+
+class JsonlSink(FileSink):
+    """One JSON object per segment - the structured transcript."""
+
+    extension = ".jsonl"
+
+    def render(self, segment: TranscriptSegment) -> str:
+        return json.dumps(asdict(segment), ensure_ascii=False) + "\n"
+
+
+class SrtSink(FileSink):
+    """SubRip subtitles."""
+
+    extension = ".srt"
+
+    def __init__(self, *args, **kwargs):
+        self._index = 0
+        super().__init__(*args, **kwargs)
+
+    def _resume(self) -> None:
+        with open(self.path, "r", encoding="utf-8") as f:
+            self._index = sum(1 for line in f if " --> " in line)
+
+    def render(self, segment: TranscriptSegment) -> str:
+        self._index += 1
+        prefix = f"[{segment.speaker}] " if segment.speaker is not None else ""
+        return (
+            f"{self._index}\n"
+            f"{format_timestamp(segment.start, ',')} --> {format_timestamp(segment.end, ',')}\n"
+            f"{prefix}{segment.text}\n\n"
+        )
+
+
+class VttSink(FileSink):
+    """WebVTT subtitles, speakers as voice spans."""
+
+    extension = ".vtt"
+
+    def _start(self) -> None:
+        self._emit("WEBVTT\n\n")
+
+    def render(self, segment: TranscriptSegment) -> str:
+        text = segment.text
+        if segment.speaker is not None:
+            text = f"<v {segment.speaker}>{text}"
+        return (
+            f"{format_timestamp(segment.start)} --> {format_timestamp(segment.end)}\n"
+            f"{text}\n\n"
+        )
+
+
+class MarkdownSink(FileSink):
+    """
+    Markdown transcript split into timestamped paragraphs.
+
+    A new paragraph starts on every speaker change or after `paragraph_seconds`.
+    """
+
+    extension = ".transcript.md"
+
+    def __init__(self, *args, paragraph_seconds: float = 60.0, **kwargs):
+        self.paragraph_seconds = paragraph_seconds
+        self._speaker: Optional[str] = None
+        self._paragraph_start: Optional[float] = None
+        super().__init__(*args, **kwargs)
+
+    def render(self, segment: TranscriptSegment) -> str:
+        text = ""
+        if (
+            self._paragraph_start is None
+            or segment.speaker != self._speaker
+            or segment.start - self._paragraph_start >= self.paragraph_seconds
+        ):
+            separator = "" if self._file.tell() == 0 else "\n\n"
+            self._speaker = segment.speaker
+            self._paragraph_start = segment.start
+            speaker = f" **{segment.speaker}:**" if segment.speaker is not None else ""
+            text = f"{separator}`[{format_timestamp(segment.start)[:8]}]`{speaker} "
+        return text + segment.text + " "
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._emit("\n")
+        super().close()
+
+
+class CollectingSink(OutputSink):
+    """Keeps all segments in memory - only use when the caller needs the full transcript."""
+
+    def __init__(self):
+        self.segments: list[TranscriptSegment] = []
+
+    def write(self, segment: TranscriptSegment) -> None:
+        self.segments.append(segment)
+
+    def text(self) -> str:
+        return render_text(self.segments)
+
+
+class PreviewSink(OutputSink):
+    """Keeps only the first `limit` characters of the plain-text transcript for console echo."""
+
+    def __init__(self, limit: int = 2000):
+        self.limit = limit
+        self.total_chars = 0
+        self._parts: list[str] = []
+        self._kept = 0
+        self._speaker: Optional[str] = None
+
+    def write(self, segment: TranscriptSegment) -> None:
+        text, self._speaker = render_text_segment(segment, self._speaker)
+        self.total_chars += len(text)
+        if self._kept < self.limit:
+            text = text[: self.limit - self._kept]
+            self._parts.append(text)
+            self._kept += len(text)
+
+    @property
+    def truncated(self) -> bool:
+        return self.total_chars > self._kept
+
+    def preview(self) -> str:
+        return "".join(self._parts).strip()
+
+
+class MultiSink(OutputSink):
+    """Fans every segment out to several sinks."""
+
+    def __init__(self, sinks: Iterable[OutputSink]):
+        self.sinks = list(sinks)
+
+    def write(self, segment: TranscriptSegment) -> None:
+        for sink in self.sinks:
+            sink.write(segment)
+
+    def close(self) -> None:
+        errors = []
+        for sink in self.sinks:
+            try:
+                sink.close()
+            except Exception as e:
+                errors.append(e)
+        if errors:
+            raise errors[0]
+
+
+SINK_FORMATS: dict[str, type[FileSink]] = {
+    "txt": TextSink,
+    "jsonl": JsonlSink,
+    "srt": SrtSink,
+    "vtt": VttSink,
+    "md": MarkdownSink,
+}
+
+
+def sink_path(base: Path, fmt: str) -> Path:
+    """Output path for format `fmt` next to `base` (e.g. output/meeting.srt)."""
+    return Path(base).with_suffix(SINK_FORMATS[fmt].extension)
+
+
+def create_sink(
+    fmt: str,
+    path: Union[str, Path],
+    flush_policy: Optional[FlushPolicy] = None,
+    append: bool = False,
+) -> FileSink:
+    """
+    Create file sink for one of SINK_FORMATS.
+
+    Raises
+    - ValueError: if the format is unknown
+    """
+    if fmt not in SINK_FORMATS:
+        raise ValueError(
+            f"Unknown output format '{fmt}' (choose from: {', '.join(SINK_FORMATS)})"
+        )
+    return SINK_FORMATS[fmt](path, flush_policy=flush_policy, append=append)
+
+
+def render_text(segments: Iterable[TranscriptSegment]) -> str:
+    """Render segments in the plain-text transcript format."""
+    parts = []
+    speaker = None
+    for segment in segments:
+        text, speaker = render_text_segment(segment, speaker)
+        parts.append(text)
+    return "".join(parts)
+
+
+def read_jsonl_segments(path: Union[str, Path]) -> Iterator[TranscriptSegment]:
+    """Read segments back from a structured (.jsonl) transcript."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield TranscriptSegment(**json.loads(line))
@@ -1,4 +1,5 @@
 import os
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -7,8 +8,6 @@ import torch
 import torchaudio
 import warnings
 
-from faster_whisper import WhisperModel
-from pyannote.audio import Pipeline
 from pyannote.audio.pipelines.utils.hook import ProgressHook
 from rich.console import Console
 from rich.progress import (
@@ -19,6 +18,18 @@ from rich.progress import (
     TimeElapsedColumn,
 )
 
+from cant_be_bothered.transcription.models import (
+    load_diarization_pipeline,
+    load_whisper_model,
+)
+from cant_be_bothered.transcription.segments import TranscriptSegment
+from cant_be_bothered.transcription.sinks import (
+    FlushPolicy,
+    MultiSink,
+    OutputSink,
+    TextSink,
+)
+
 warnings.filterwarnings("ignore", category=UserWarning)
 warnings.filterwarnings("ignore")
 
@@ -35,8 +46,26 @@ def transcribe_audio(
     enable_diarization: bool = False,
     min_speakers: Optional[int] = None,
     max_speakers: Optional[int] = None,
-) -> str:
-    # Load model (will download on first run)
+    sinks: Optional[list[OutputSink]] = None,
+    flush_policy: Optional[FlushPolicy] = None,
+    time_offset: float = 0.0,
+    quiet: bool = False,
+    num_workers: int = 1,
+) -> None:
+    """
+    Transcribe audio file and stream the segments into output sinks.
+
+    - sinks: where the segments go (default: plain text into output_file);
+      all sinks are closed when transcription finishes; add a CollectingSink
+      to get the whole transcript in memory
+    - flush_policy: flush cadence of the default text sink
+    - time_offset: seconds added to all timestamps (audio is a tail of a longer recording)
+    - quiet: no progress bars or status messages, so several transcriptions can run in parallel
+    - num_workers: parallel transcriptions the (shared) Whisper model allows
+    """
+    started = time.perf_counter()
+
+    # Load model (from the local model store if prefetched, otherwise downloads on first run)
     device = (
         device if device != "auto" else ("cuda" if torch.cuda.is_available() else "cpu")
     )
@@ -45,17 +74,23 @@ def transcribe_audio(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
+        disable=quiet,
     ) as progress:
         task = progress.add_task("[cyan]Loading Whisper model...", total=None)
 
-        model = WhisperModel(
+        model = load_whisper_model(
             model_size,
-            device=device,
-            compute_type=compute_type if device == "cuda" else "int8",
+            device,
+            compute_type if device == "cuda" else "int8",
+            num_workers=num_workers,
         )
 
         progress.remove_task(task)
-        console.print(":white_check_mark: [green]Whisper model loaded![/green]")
+        if not quiet:
+            console.print(
+                f":white_check_mark: [green]Whisper model loaded![/green] "
+                f"[dim]({time.perf_counter() - started:.1f}s)[/dim]"
+            )
 
     diarization_output = None
     if enable_diarization:
@@ -66,19 +101,21 @@ def transcribe_audio(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console,
+            disable=quiet,
         ) as progress:
             task = progress.add_task("[cyan]Loading diarization model...", total=None)
             dotenv.load_dotenv()
 
-            diarization_pipeline = Pipeline.from_pretrained(
-                "pyannote/speaker-diarization-3.1", token=os.getenv("HF_TOKEN")
+            diarization_pipeline = load_diarization_pipeline(
+                device, token=os.getenv("HF_TOKEN")
             )
-            diarization_pipeline.to(torch.device(device))
 
             progress.remove_task(task)
-            console.print(":white_check_mark: [green]Diarization model loaded![/green]")
+            if not quiet:
+                console.print(":white_check_mark: [green]Diarization model loaded![/green]")
 
-        console.print("[cyan]Performing speaker diarization...[/cyan]")
+        if not quiet:
+            console.print("[cyan]Performing speaker diarization...[/cyan]")
         waveform, sample_rate = torchaudio.load(audio_path)
         diarization_params = {"waveform": waveform, "sample_rate": sample_rate}
         kwargs = {}
@@ -87,14 +124,16 @@ def transcribe_audio(
         if max_speakers is not None:
             kwargs["max_speakers"] = max_speakers
 
-        with ProgressHook() as hook:
-            diarization_output = diarization_pipeline(
-                diarization_params,
-                hook=hook,
-                **kwargs,
-            )
-
-        console.print(":white_check_mark: [green]Diarization complete![/green]")
+        if quiet:
+            diarization_output = diarization_pipeline(diarization_params, **kwargs)
+        else:
+            with ProgressHook() as hook:
+                diarization_output = diarization_pipeline(
+                    diarization_params,
+                    hook=hook,
+                    **kwargs,
+                )
+            console.print(":white_check_mark: [green]Diarization complete![/green]")
 
     # Transcribe
     segments, info = model.transcribe(
@@ -106,10 +145,8 @@ def transcribe_audio(
         word_timestamps=False,  # Enable word timestamps for better speaker alignment
     )
 
-    transcript_parts = []
-
-    # Create file where the transcript will be saved incrementally by each segment
-    output_file.parent.mkdir(parents=True, exist_ok=True)
+    if sinks is None:
+        sinks = [TextSink(output_file, flush_policy=flush_policy)]
 
     # Calculate approximate total segments based on audio duration
     # This is an estimate since segments are generated dynamically
@@ -123,18 +160,20 @@ def transcribe_audio(
         BarColumn(),
         TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
         TimeElapsedColumn(),
+        disable=quiet,
     ) as progress:
         task = progress.add_task(
             "[cyan]Transcribing audio...",
             total=estimated_segments if estimated_segments > 0 else 100,
         )
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            current_speaker = None
+        with MultiSink(sinks) as sink:
             speaker = None
+            first_segment_at = None
 
             for segment in segments:
-                text = segment.text.strip()
+                if first_segment_at is None:
+                    first_segment_at = time.perf_counter() - started
 
                 # Determine speaker for the segment if diarization is enabled
                 if enable_diarization and diarization_output:
@@ -144,36 +183,23 @@ def transcribe_audio(
                             speaker = turn_speaker
                             break
 
-                # If speaker changed, add a new speaker label
-                if enable_diarization and speaker != current_speaker:
-                    current_speaker = speaker
-                    speaker_label = format_speaker_label(
-                        current_speaker, template="\n\n[{}]\n"
+                # Sinks flush on their own schedule, so partial results survive an interruption
+                sink.write(
+                    TranscriptSegment(
+                        start=segment.start + time_offset,
+                        end=segment.end + time_offset,
+                        text=segment.text.strip(),
+                        speaker=speaker,
                     )
-                    f.write(speaker_label)
-                    transcript_parts.append(speaker_label)
-
-                transcript_parts.append(text)
-                f.write(text + " ")
-
-                # Write to file immediately, so that if the process is interrupted, we still have partial results
-                f.flush()
+                )
 
                 progress.update(task, advance=1)
 
         progress.update(task, completed=progress.tasks[task].total)
 
-    console.print(":white_check_mark: [green]Transcription complete![/green]")
-
-    full_transcript = "".join(transcript_parts)
-
-    return full_transcript
+    if quiet:
+        return
 
-
-def format_speaker_label(speaker_id: str, template: str = "\n\n[{}]\n") -> str:
-    """Format speaker label for transcript.
-
-    This function is here for future, because different LLMs might work better with different speaker label formats.
-    For example, some studies show that using Markdown format might improve model performance.
-    """
-    return template.format(speaker_id)
+    console.print(":white_check_mark: [green]Transcription complete![/green]")
+    if first_segment_at is not None:
+        console.print(f"[dim]Cold start - time to first segment: {first_segment_at:.1f}s[/dim]")
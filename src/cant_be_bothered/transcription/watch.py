@@ -0,0 +1,241 @@
+"""
+Watch-folder mode - incremental transcription of new and growing recordings.
+
+For every recording the watcher remembers how many seconds were already
+transcribed. When a file grows, only the new tail is cut out, transcribed
+and appended to the existing transcript files with shifted timestamps.
+"""
+
+import json
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from rich.console import Console
+
+from cant_be_bothered.audio.cut import cut_audio_segment, get_audio_duration
+from cant_be_bothered.transcription.sinks import (
+    FlushPolicy,
+    MultiSink,
+    create_sink,
+    sink_path,
+)
+from cant_be_bothered.transcription.transcriber import transcribe_audio
+
+AUDIO_EXTENSIONS = frozenset(
+    {".wav", ".mp3", ".aac", ".m4a", ".flac", ".ogg", ".opus", ".wma"}
+)
+STATE_NAME = ".watch_state.json"
+# Shorter tails are left for the next round, Whisper can't do much with them anyway
+MIN_TAIL_SECONDS = 1.0
+
+console = Console()
+
+
+@dataclass
+class FileState:
+    size: int
+    mtime_ns: int
+    processed_seconds: float
+    # Byte length of every transcript file after the last successful tail
+    outputs: dict[str, int] = field(default_factory=dict)
+
+
+class WatchState:
+    """Transcribed position of every watched recording, persisted as JSON."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self.files: dict[str, FileState] = {}
+        if path.exists():
+            data = json.loads(path.read_text(encoding="utf-8"))
+            self.files = {name: FileState(**f) for name, f in data.items()}
+
+    def get(self, name: str) -> Optional[FileState]:
+        with self._lock:
+            return self.files.get(name)
+
+    def update(self, name: str, state: FileState) -> None:
+        with self._lock:
+            self.files[name] = state
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(
+                json.dumps({n: asdict(f) for n, f in self.files.items()}, indent=2),
+                encoding="utf-8",
+            )
+            tmp.replace(self.path)
+
+
+class FolderWatcher:
+    """
+    Polls `directory` for new/grown recordings and transcribes their unprocessed tails.
+
+    - formats: transcript formats appended to in `output_dir` (see SINK_FORMATS)
+    - workers: number of recordings transcribed in parallel
+    - poll_interval: seconds between directory scans
+    - debounce: a file must be unmodified for this many seconds before it is
+      processed, so half-written files are not picked up
+    - transcribe_options: passed to transcribe_audio (model_size, language, device, ...)
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        output_dir: Path,
+        formats: list[str],
+        workers: int = 2,
+        poll_interval: float = 5.0,
+        debounce: float = 10.0,
+        flush_policy: Optional[FlushPolicy] = None,
+        **transcribe_options,
+    ):
+        self.directory = Path(directory)
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.formats = formats
+        self.workers = max(1, workers)
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.flush_policy = flush_policy
+        self.transcribe_options = transcribe_options
+        self.state = WatchState(self.output_dir / STATE_NAME)
+        # Files that failed, skipped until they change again
+        self._failed: dict[str, tuple[int, int]] = {}
+
+    def scan(self) -> list[Path]:
+        """Recordings that are complete (debounced) and have unprocessed changes."""
+        ready = []
+        now = time.time()
+        for path in sorted(self.directory.iterdir()):
+            if not path.is_file() or path.suffix.lower() not in AUDIO_EXTENSIONS:
+                continue
+
+            stat = path.stat()
+            if now - stat.st_mtime < self.debounce:
+                continue  # still being written
+
+            signature = (stat.st_size, stat.st_mtime_ns)
+            previous = self.state.get(path.name)
+            if previous is not None and (previous.size, previous.mtime_ns) == signature:
+                continue
+            if self._failed.get(path.name) == signature:
+                continue
+            ready.append(path)
+        return ready
+
+    def process(self, path: Path) -> float:
+        """Transcribe the unprocessed tail of a recording, returns its length in seconds."""
+        stat = path.stat()
+        previous = self.state.get(path.name)
+
+        processed = previous.processed_seconds if previous is not None else 0.0
+        append = previous is not None
+        if previous is not None and stat.st_size < previous.size:
+            # File shrank - it was replaced by a new recording, start over
+            processed = 0.0
+            append = False
+
+        paths = {fmt: sink_path(self.output_dir / path.name, fmt) for fmt in self.formats}
+        if append:
+            # Drop output of a tail that failed or was interrupted, it is transcribed again
+            for out in paths.values():
+                length = previous.outputs.get(out.name)
+                if length is not None and out.exists() and out.stat().st_size > length:
+                    with open(out, "r+b") as f:
+                        f.truncate(length)
+
+        duration = get_audio_duration(path)
+        if duration - processed >= MIN_TAIL_SECONDS:
+            with tempfile.TemporaryDirectory(prefix="cbb_watch_") as tmp:
+                tail = cut_audio_segment(
+                    input_path=path,
+                    start=str(processed),
+                    end=str(duration),
+                    output_path=Path(tmp) / f"{path.stem}_tail.wav",
+                )
+                sinks = [
+                    create_sink(
+                        fmt, out, flush_policy=self.flush_policy, append=append
+                    )
+                    for fmt, out in paths.items()
+                ]
+                # Sinks are closed even if transcription fails before it starts writing
+                with MultiSink(sinks):
+                    transcribe_audio(
+                        audio_path=tail,
+                        sinks=sinks,
+                        time_offset=processed,
+                        quiet=True,
+                        # One model is shared by all workers, it needs a worker per thread
+                        num_workers=self.workers,
+                        **self.transcribe_options,
+                    )
+        else:
+            duration = processed
+
+        self.state.update(
+            path.name,
+            FileState(
+                size=stat.st_size,
+                mtime_ns=stat.st_mtime_ns,
+                processed_seconds=duration,
+                outputs={
+                    out.name: out.stat().st_size
+                    for out in paths.values()
+                    if out.exists()
+                },
+            ),
+        )
+        return duration - processed
+
+    def _report(self, path: Path, future: Future) -> None:
+        try:
+            seconds = future.result()
+        except Exception as e:
+            if path.exists():
+                stat = path.stat()
+                self._failed[path.name] = (stat.st_size, stat.st_mtime_ns)
+            console.print(f":x: [bold red]Error:[/bold red] {path.name}: {e}")
+            return
+
+        if seconds > 0:
+            console.print(
+                f":white_check_mark: [green]{path.name}[/green] "
+                f"[dim]+{seconds:.0f}s of audio transcribed[/dim]"
+            )
+
+    def run(self, once: bool = False) -> None:
+        """
+        Watch the directory until interrupted.
+
+        - once: process the recordings that are ready now and return
+        """
+        in_flight: dict[Path, Future] = {}
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="cbb-watch"
+        ) as pool:
+            try:
+                while True:
+                    for path in self.scan():
+                        if path not in in_flight:
+                            in_flight[path] = pool.submit(self.process, path)
+
+                    if once:
+                        wait(in_flight.values())
+
+                    for path, future in list(in_flight.items()):
+                        if future.done():
+                            del in_flight[path]
+                            self._report(path, future)
+
+                    if once:
+                        return
+                    time.sleep(self.poll_interval)
+            except KeyboardInterrupt:
+                pool.shutdown(wait=True, cancel_futures=True)
+                raise